@@ -10,19 +10,25 @@ from _pytest.config import Config
 from adaptavist import Adaptavist
 
 
+def load_global_config() -> dict[str, Any]:
+    """Load config parameters from "config/global_config.json". Return an empty dictionary if the file does not exist."""
+    config_file_name = os.path.join("config", "global_config.json")
+    if not os.path.exists(os.path.abspath(config_file_name)):
+        return {}
+    with open(config_file_name, "r", encoding="utf-8") as config_file:
+        try:
+            return json.load(config_file)
+        except Exception as ex:
+            raise ValueError(f'Failed to load config from file "{config_file}"!', ex) from ex
+
+
 class ATMConfiguration:
     """Configuration class to read config parameters (either from env or from "global_config.json")."""
 
     def __init__(self, pytest_config: Config | None = None):
         self.global_config = {}
         self.pytest_config = pytest_config.inicfg if pytest_config else {}
-        config_file_name = os.path.join("config", "global_config.json")
-        if os.path.exists(os.path.abspath(config_file_name)):
-            with open(config_file_name, "r", encoding="utf-8") as config_file:
-                try:
-                    self.global_config.update(json.load(config_file))
-                except Exception as ex:
-                    raise ValueError(f'Failed to load config from file "{config_file}"!', ex) from ex
+        self.global_config.update(load_global_config())
 
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -14,7 +14,7 @@ setup(
     platforms="any",
     python_requires=">=3.8",
     install_requires=["adaptavist-fixed==0.5", "pytest>=5.4.0", "pytest-assume>=2.3.2", "pytest-metadata>=1.6.0"],
-    extras_require={"test": ["beautifulsoup4", "lxml", "requests"]},
+    extras_require={"test": ["beautifulsoup4", "lxml", "pytest-xdist", "requests"]},
     setup_requires=["setuptools_scm"],
     keywords="python pytest adaptavist kanoah tm4j jira test testmanagement report",
     classifiers=[
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Tuple
+from typing import Any, Callable, Dict, Tuple
 from unittest.mock import MagicMock
 
 import requests
@@ -12,6 +12,14 @@ from _pytest.pytester import HookRecorder
 from pytest_adaptavist._atm_configuration import ATMConfiguration
 
 AdaptavistMock = Tuple[MagicMock, MagicMock, MagicMock]
+GlobalConfig = Callable[[Dict[str, Any]], None]
+
+TEST_TEST_T123 = """
+import pytest
+
+def test_TEST_T123():
+    assert True
+"""
 
 
 def system_test_preconditions() -> bool:
@@ -2,14 +2,14 @@
 from __future__ import annotations
 
 import shutil
-from typing import Generator
-from unittest.mock import patch
+from typing import Any, Generator
+from unittest.mock import MagicMock, patch
 
 import pytest
 from _pytest.config import Config
 from adaptavist import Adaptavist
 
-from . import AdaptavistMock, read_global_config, system_test_preconditions
+from . import AdaptavistMock, GlobalConfig, read_global_config, system_test_preconditions
 
 pytest_plugins = ("pytester",)
 
@@ -37,6 +37,13 @@ def set_test_plan(monkeypatch: pytest.MonkeyPatch, request: pytest.FixtureReques
         monkeypatch.setenv("TEST_PLAN_KEY", create_test_plan or "")
 
 
+@pytest.fixture
+def pytester(pytester: pytest.Pytester, monkeypatch: pytest.MonkeyPatch) -> pytest.Pytester:
+    """Pytester without plugins the inner runs don't need. The cache provider would write .pytest_cache on every run."""
+    monkeypatch.setenv("PYTEST_ADDOPTS", "-p no:cacheprovider -p no:doctest -p no:junitxml -p no:nose")
+    return pytester
+
+
 @pytest.fixture
 def adaptavist(pytester: pytest.Pytester) -> Generator[Adaptavist, None, None]:
     """Establish connection to Adaptavist."""
@@ -57,11 +64,19 @@ def create_test_run(monkeypatch: pytest.MonkeyPatch, adaptavist: Adaptavist) ->
 
 
 @pytest.fixture
-def configure(pytester: pytest.Pytester):
+def global_config(monkeypatch: pytest.MonkeyPatch) -> GlobalConfig:
+    """Provide the global config from memory instead of reading config/global_config.json."""
+
+    def set_global_config(config: dict[str, Any]):
+        monkeypatch.setattr("pytest_adaptavist._atm_configuration.load_global_config", lambda: config)
+
+    return set_global_config
+
+
+@pytest.fixture
+def configure(global_config: GlobalConfig):
     """Configure environment for unit tests."""
-    pytester.mkdir("config")
-    with open("config/global_config.json", "w", encoding="utf8") as file:
-        file.write('{"jira_server": "https://jira.test", "project_key": "TEST", "test_run_key":"TEST-C1"}')
+    global_config({"jira_server": "https://jira.test", "project_key": "TEST", "test_run_key": "TEST-C1"})
 
 
 @pytest.fixture
@@ -74,33 +89,22 @@ def valid_user() -> Generator[None, None, None]:
 @pytest.fixture
 def adaptavist_mock(valid_user: None) -> Generator[AdaptavistMock, None, None]:
     """Patch adaptavist to prevent real I/O."""
-    with patch(
-        "adaptavist.Adaptavist.get_test_result",
-        return_value={"scriptResults": [{"status": "Pass", "index": "0"}], "status": "Pass"},
-    ), patch(
-        "adaptavist.Adaptavist.get_test_run",
-        return_value={"items": [{"testCaseKey": "TEST-T121"}, {"testCaseKey": "TEST-T123"}, {"testCaseKey": "TEST-T124"}]},
-    ), patch(
-        "adaptavist.Adaptavist.get_test_cases", return_value=[{"key": "TEST-T123"}]
-    ), patch(
-        "adaptavist.Adaptavist.get_test_run_by_name", return_value={"key": "TEST_RUN_TEST"}
-    ), patch(
-        "adaptavist.Adaptavist.get_test_case", return_value={"name": "TEST-T123", "priority": "Normal"}
-    ), patch(
-        "adaptavist.Adaptavist.edit_test_case", return_value=True
-    ), patch(
-        "adaptavist.Adaptavist._delete"
-    ), patch(
-        "adaptavist.Adaptavist._get"
-    ), patch(
-        "adaptavist.Adaptavist._post"
-    ), patch(
-        "adaptavist.Adaptavist._put"
-    ), patch(
-        "adaptavist.Adaptavist.create_test_result"
-    ) as ctr, patch(
-        "adaptavist.Adaptavist.edit_test_result_status"
-    ) as etrs, patch(
-        "adaptavist.Adaptavist.edit_test_script_status"
-    ) as etss:
-        yield ctr, etrs, etss
+    mocks = {
+        "get_test_result": MagicMock(return_value={"scriptResults": [{"status": "Pass", "index": "0"}], "status": "Pass"}),
+        "get_test_run": MagicMock(
+            return_value={"items": [{"testCaseKey": "TEST-T121"}, {"testCaseKey": "TEST-T123"}, {"testCaseKey": "TEST-T124"}]}
+        ),
+        "get_test_cases": MagicMock(return_value=[{"key": "TEST-T123"}]),
+        "get_test_run_by_name": MagicMock(return_value={"key": "TEST_RUN_TEST"}),
+        "get_test_case": MagicMock(return_value={"name": "TEST-T123", "priority": "Normal"}),
+        "edit_test_case": MagicMock(return_value=True),
+        "_delete": MagicMock(),
+        "_get": MagicMock(),
+        "_post": MagicMock(),
+        "_put": MagicMock(),
+        "create_test_result": MagicMock(),
+        "edit_test_result_status": MagicMock(),
+        "edit_test_script_status": MagicMock(),
+    }
+    with patch.multiple(Adaptavist, **mocks):
+        yield mocks["create_test_result"], mocks["edit_test_result_status"], mocks["edit_test_script_status"]
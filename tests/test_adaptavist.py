@@ -6,7 +6,7 @@ from unittest.mock import patch
 
 import pytest
 
-from . import AdaptavistMock
+from . import TEST_TEST_T123, AdaptavistMock
 
 
 @pytest.mark.usefixtures("configure")
@@ -15,16 +15,9 @@ class TestAdaptavistUnit:
 
     def test_adaptavist_reporting(self, pytester: pytest.Pytester, adaptavist_mock: AdaptavistMock):
         """Test reporting results to Adaptavist."""
-        pytester.makepyfile(
-            """
-            import pytest
-
-            def test_TEST_T123():
-                assert True
-        """
-        )
+        pytester.makepyfile(TEST_TEST_T123)
         ctr, _, _ = adaptavist_mock
-        pytester.runpytest("--adaptavist")
+        pytester.inline_run("--adaptavist")
         ctr.assert_called_once_with(
             test_run_key="TEST-C1",
             test_case_key="TEST-T123",
@@ -36,16 +29,9 @@ class TestAdaptavistUnit:
     @pytest.mark.usefixtures("adaptavist_mock")
     def test_unknown_user(self, pytester: pytest.Pytester, caplog: pytest.LogCaptureFixture):
         """Test the correct behavior of an unknown user."""
-        pytester.makepyfile(
-            """
-            import pytest
-
-            def test_TEST_T123():
-                assert True
-        """
-        )
+        pytester.makepyfile(TEST_TEST_T123)
         with patch("pytest_adaptavist.atm_user_is_valid", return_value=False):
-            pytester.runpytest("--adaptavist")
+            pytester.inline_run("--adaptavist")
             assert caplog.records[-1].funcName == "pytest_configure"
             assert caplog.records[-1].levelno == logging.WARN
             assert (
@@ -64,7 +50,7 @@ class TestAdaptavistUnit:
         """
         )
         _, _, etss = adaptavist_mock
-        pytester.runpytest("--adaptavist")
+        pytester.inline_run("--adaptavist")
         etss.assert_called_once_with(
             test_run_key="TEST-C1",
             test_case_key="TEST-T123",
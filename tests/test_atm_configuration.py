@@ -2,7 +2,7 @@
 import pytest
 from _pytest.config import ExitCode
 
-from pytest_adaptavist._atm_configuration import ATMConfiguration
+from pytest_adaptavist._atm_configuration import ATMConfiguration, load_global_config
 
 
 def test_get(monkeypatch: pytest.MonkeyPatch):
@@ -59,6 +59,23 @@ def test_get_bool_exception():
         atm_config.get_bool("test_bool")
 
 
+def test_load_global_config(pytester: pytest.Pytester):
+    """Test that a valid ./config/global_config.json is loaded into the atm configuration."""
+    pytester.mkdir("config")
+    with open("config/global_config.json", "w", encoding="utf8") as file:
+        file.write('{"jira_server": "https://jira.test", "project_key": "TEST", "test_run_key":"TEST-C1"}')
+    expected = {"jira_server": "https://jira.test", "project_key": "TEST", "test_run_key": "TEST-C1"}
+    assert load_global_config() == expected
+    assert ATMConfiguration().global_config == expected
+
+
+@pytest.mark.usefixtures("pytester")
+def test_load_global_config_missing_file():
+    """Test that an empty config is returned if there is no ./config/global_config.json"""
+    assert not load_global_config()
+    assert not ATMConfiguration().global_config
+
+
 def test_atm_no_json_file(pytester: pytest.Pytester):
     """Test if atm configuration will fail if there is no valid json found at ./config/global_config.json"""
     pytester.mkdir("config")
@@ -3,6 +3,8 @@ import pytest
 from _pytest.config import ExitCode
 from _pytest.pytester import LineMatcher
 
+from . import TEST_TEST_T123
+
 
 @pytest.mark.usefixtures("configure")
 class TestCliUnit:
@@ -30,14 +32,7 @@ class TestCliUnit:
 
     def test_cycle_info_urls(self, pytester: pytest.Pytester):
         """Test that the cycle information urls are build correctly."""
-        pytester.makepyfile(
-            """
-            import pytest
-
-            def test_TEST_T123():
-                assert True
-        """
-        )
+        pytester.makepyfile(TEST_TEST_T123)
         report = pytester.runpytest("--adaptavist")
         matcher = LineMatcher(report.outlines)
         matcher.fnmatch_lines(
@@ -50,14 +45,7 @@ class TestCliUnit:
 
     def test_invalid_branch(self, pytester: pytest.Pytester, monkeypatch: pytest.MonkeyPatch):
         """Test the correct behavior of an invalid branch."""
-        pytester.makepyfile(
-            """
-            import pytest
-
-            def test_TEST_T123():
-                assert True
-        """
-        )
+        pytester.makepyfile(TEST_TEST_T123)
         monkeypatch.setenv("GIT_BRANCH", "test")
         report = pytester.runpytest("--adaptavist", "--restrict-branch")
         assert report.ret == ExitCode.INTERNAL_ERROR
@@ -2,17 +2,17 @@
 import pytest
 from adaptavist import Adaptavist
 
-from . import AdaptavistMock, get_test_values, read_global_config, system_test_preconditions
+from . import AdaptavistMock, GlobalConfig, get_test_values, read_global_config, system_test_preconditions
 
 
 class TestDecoratorUnit:
     """Test decorator usage on unit test level."""
 
-    @pytest.mark.parametrize("marker", ["mark.block", "mark.project", "mark.testcase"])
-    def test_adaptavist_markers(self, pytester: pytest.Pytester, marker: str):
+    def test_adaptavist_markers(self, pytester: pytest.Pytester):
         """Test registration of custom markers."""
-        result = pytester.runpytest("--markers")
-        assert any(marker in line for line in result.stdout.lines)
+        output = str(pytester.runpytest("--markers").stdout)
+        for marker in ("mark.block", "mark.project", "mark.testcase"):
+            assert marker in output
 
     @pytest.mark.usefixtures("adaptavist_mock", "configure")
     def test_block_decorator_with_class_decorator(self, pytester: pytest.Pytester):
@@ -88,57 +88,41 @@ class TestDecoratorUnit:
     def test_blockif_decorator(self, pytester: pytest.Pytester):
         """Test blockif decorator."""
         pytester.makepyfile(
-            """
+            test_blockif_true="""
             import pytest
 
             @pytest.mark.blockif(True, reason="Test")
             def test_dummy():
                 assert True
-        """
-        )
-        outcome = pytester.runpytest().parseoutcomes()
-        assert outcome["blocked"] == 1
-        assert "passed" not in outcome
-
-        pytester.makepyfile(
-            """
+            """,
+            test_blockif_class="""
             import pytest
 
             @pytest.mark.blockif(True, reason="Test")
             class Test:
                 def test_dummy():
                     assert True
-        """
-        )
-        outcome = pytester.runpytest().parseoutcomes()
-        assert outcome["blocked"] == 1
-        assert "passed" not in outcome
-
-        pytester.makepyfile(
-            """
+            """,
+            test_blockif_false="""
             import pytest
 
             @pytest.mark.blockif(False, reason="Test")
-            def test_dummy():
+            def test_blockif_false():
                 assert True
-        """
-        )
-        outcome = pytester.runpytest().parseoutcomes()
-        assert outcome["passed"] == 1
-        assert "blocked" not in outcome
-
-        pytester.makepyfile(
-            """
+            """,
+            test_blockif_multiple_conditions="""
             import pytest
 
             @pytest.mark.blockif(False, True, reason="Test")
             def test_dummy():
                 assert True
-        """
+            """,
         )
-        outcome = pytester.runpytest().parseoutcomes()
-        assert outcome["blocked"] == 1
-        assert "passed" not in outcome
+        result = pytester.runpytest("-v")
+        outcome = result.parseoutcomes()
+        assert outcome["blocked"] == 3
+        assert outcome["passed"] == 1
+        result.stdout.fnmatch_lines(["*test_blockif_false.py::test_blockif_false PASSED*"])
 
     @pytest.mark.usefixtures("adaptavist_mock", "configure")
     def test_decorator_preferation(self, pytester: pytest.Pytester):
@@ -155,8 +139,7 @@ class TestDecoratorUnit:
                     assert True
         """
         )
-        report = pytester.runpytest("--adaptavist")
-        outcome = report.parseoutcomes()
+        outcome = pytester.runpytest("--adaptavist").parseoutcomes()
         assert outcome["blocked"] == 1
         assert "passed" not in outcome
 
@@ -175,7 +158,7 @@ class TestDecoratorUnit:
         """
         )
         _, etrs, _ = adaptavist_mock
-        pytester.runpytest("--adaptavist").assert_outcomes(passed=1)
+        pytester.inline_run("--adaptavist").assertoutcome(passed=1)
         assert etrs.call_count == 1
         assert etrs.call_args.kwargs["test_case_key"] == "TEST-T121"
 
@@ -194,8 +177,7 @@ class TestDecoratorUnit:
                     assert True
         """
         )
-        report = pytester.runpytest("--adaptavist")
-        outcome = report.parseoutcomes()
+        outcome = pytester.runpytest("--adaptavist").parseoutcomes()
         assert outcome["blocked"] == 1
         assert "passed" not in outcome
 
@@ -211,7 +193,7 @@ class TestDecoratorUnit:
                 assert True
         """
         )
-        pytester.runpytest("--adaptavist").assert_outcomes(skipped=1)
+        pytester.inline_run("--adaptavist").assertoutcome(skipped=1)
 
     def test_project_decorator(self, pytester: pytest.Pytester, adaptavist_mock: AdaptavistMock):
         """Test project decorator."""
@@ -226,11 +208,13 @@ class TestDecoratorUnit:
         """
         )
         _, etrs, _ = adaptavist_mock
-        pytester.runpytest("--adaptavist")
+        pytester.inline_run("--adaptavist")
         assert etrs.call_args.kwargs["test_case_key"] == "MARKER-T16"
 
     @pytest.mark.usefixtures("configure")
-    def test_respect_project_decorator_if_project_key_set(self, pytester: pytest.Pytester, adaptavist_mock: AdaptavistMock):
+    def test_respect_project_decorator_if_project_key_set(
+        self, pytester: pytest.Pytester, adaptavist_mock: AdaptavistMock, global_config: GlobalConfig
+    ):
         """Respect a project key if set in a config file."""
         pytester.makepyfile(
             """
@@ -245,10 +229,9 @@ class TestDecoratorUnit:
                     pass
         """
         )
-        with open("config/global_config.json", "w", encoding="utf8") as file:
-            file.write('{"project_key": "OTHERTEST"}')
+        global_config({"project_key": "OTHERTEST"})
         _, etrs, _ = adaptavist_mock
-        pytester.runpytest("--adaptavist")
+        pytester.inline_run("--adaptavist")
         assert etrs.call_args_list[0].kwargs["test_case_key"] == "OTHERTEST-T1"
         assert etrs.call_args_list[1].kwargs["test_case_key"] == "TEST-T17"
 
@@ -24,7 +24,7 @@ class TestMetaBlockUnit:
         """
         )
         _, _, etss = adaptavist_mock
-        pytester.runpytest("--adaptavist")
+        pytester.inline_run("--adaptavist")
         assert "We want to see this message" in etss.call_args.kwargs["comment"]
 
         # Test message_on_fail for a passing test case
@@ -37,7 +37,7 @@ class TestMetaBlockUnit:
                     mb_1.check(True, message_on_fail="We don't want to see this message")
         """
         )
-        pytester.runpytest("--adaptavist")
+        pytester.inline_run("--adaptavist")
         assert "We don't want to see this message" not in etss.call_args.kwargs["comment"]
 
     def test_message_on_pass(self, pytester: pytest.Pytester, adaptavist_mock: AdaptavistMock):
@@ -54,7 +54,7 @@ class TestMetaBlockUnit:
         """
         )
         _, _, etss = adaptavist_mock
-        pytester.runpytest("--adaptavist")
+        pytester.inline_run("--adaptavist")
         assert "We want to see this message" in etss.call_args.kwargs["comment"]
 
         # Test message_on_pass for a failing test case
@@ -67,7 +67,7 @@ class TestMetaBlockUnit:
                     mb_1.check(False, message_on_pass="We don't want to see this message")
         """
         )
-        pytester.runpytest("--adaptavist")
+        pytester.inline_run("--adaptavist")
         assert "We don't want to see this message" not in etss.call_args.kwargs["comment"]
 
     def test_description(self, pytester: pytest.Pytester, adaptavist_mock: AdaptavistMock):
@@ -83,59 +83,40 @@ class TestMetaBlockUnit:
         """
         )
         _, _, etss = adaptavist_mock
-        pytester.runpytest("--adaptavist")
+        pytester.inline_run("--adaptavist")
         assert etss.call_args.kwargs["comment"].count("This should be displayed twice") == 2
 
     @pytest.mark.usefixtures("adaptavist_mock")
     def test_attachment(self, pytester: pytest.Pytester):
         """Test the correct usage of the attachment parameter."""
         pytester.maketxtfile(first_file="foo")
-
-        # Test attachment for a passing test case
         pytester.makepyfile(
-            """
+            # Test attachment for a passing test case
+            test_passing="""
             import pytest
 
             def test_TEST_T123(meta_block):
                 with meta_block(1) as mb_1:
                     mb_1.check(True, attachment="first_file.txt")
-        """
-        )
-        with patch("adaptavist.Adaptavist.add_test_script_attachment") as atsa:
-            pytester.runpytest("--adaptavist")
-            assert "first_file.txt" in atsa.call_args.kwargs["filename"]
-
-        # Test attachment for a failing test case
-        pytester.makepyfile(
-            """
+            """,
+            # Test attachment for a failing test case
+            test_failing="""
             import pytest
 
             def test_TEST_T123(meta_block):
                 with meta_block(1) as mb_1:
                     mb_1.check(False, attachment="first_file.txt")
-        """
-        )
-        with patch("adaptavist.Adaptavist.add_test_script_attachment") as atsa:
-            pytester.runpytest("--adaptavist")
-            assert "first_file.txt" in atsa.call_args.kwargs["filename"]
-
-        # Test attaching with a file handle
-        pytester.makepyfile(
-            """
+            """,
+            # Test attaching with a file handle
+            test_file_handle="""
             import pytest
 
             def test_TEST_T123(meta_block):
                 with meta_block(1) as mb_1, open("first_file.txt", "rb") as fh:
                     mb_1.check(False, attachment=fh)
-        """
-        )
-        with patch("adaptavist.Adaptavist.add_test_script_attachment") as atsa:
-            pytester.runpytest("--adaptavist")
-            assert "first_file.txt" in atsa.call_args.kwargs["filename"]
-
-        # Test attaching a StringIO object
-        pytester.makepyfile(
-            """
+            """,
+            # Test attaching a StringIO object
+            test_string_io="""
             import pytest
             from io import StringIO
 
@@ -144,11 +125,13 @@ class TestMetaBlockUnit:
                     attachment = StringIO()
                     attachment.name = "first_file.txt"
                     mb_1.check(False, attachment=attachment)
-        """
+            """,
         )
         with patch("adaptavist.Adaptavist.add_test_script_attachment") as atsa:
-            pytester.runpytest("--adaptavist")
-            assert "first_file.txt" in atsa.call_args.kwargs["filename"]
+            pytester.inline_run("--adaptavist")
+        assert atsa.call_count == 4
+        for call in atsa.call_args_list:
+            assert "first_file.txt" in call.kwargs["filename"]
 
     @pytest.mark.usefixtures("adaptavist_mock")
     def test_description_of_test_steps_printed(self, pytester: pytest.Pytester):
@@ -188,7 +171,7 @@ class TestMetaBlockUnit:
         """
         )
         _, etrs, _ = adaptavist_mock
-        pytester.runpytest("--adaptavist")
+        pytester.inline_run("--adaptavist")
         assert etrs.call_count == 4  # 3 meta blocks and 1 overall result
 
     @pytest.mark.usefixtures("adaptavist_mock")
@@ -205,7 +188,7 @@ class TestMetaBlockUnit:
                     assert True
         """
         )
-        pytester.runpytest("--adaptavist").assert_outcomes(skipped=1)
+        pytester.inline_run("--adaptavist").assertoutcome(skipped=1)
 
     @pytest.mark.usefixtures("adaptavist_mock")
     def test_meta_block_timeout_fail(self, pytester: pytest.Pytester):
@@ -221,7 +204,7 @@ class TestMetaBlockUnit:
                     assert True
         """
         )
-        pytester.runpytest("--adaptavist").assert_outcomes(failed=1)
+        pytester.inline_run("--adaptavist").assertoutcome(failed=1)
 
     @pytest.mark.usefixtures("adaptavist_mock")
     def test_meta_block_check_unknown_arguments(self, pytester: pytest.Pytester):
@@ -236,7 +219,7 @@ class TestMetaBlockUnit:
         """
         )
         report = pytester.runpytest("--adaptavist")
-        assert any(("Unknown arguments: {'unknown_kwargs': 123}" in x for x in report.outlines))
+        assert "Unknown arguments: {'unknown_kwargs': 123}" in str(report.stdout)
 
     def test_meta_block_assume(self, pytester: pytest.Pytester, adaptavist_mock: AdaptavistMock):
         """Test if meta_block is using assume correctly. Step 2 must be executed even if step 1 fails."""
@@ -251,7 +234,7 @@ class TestMetaBlockUnit:
                     mb_2.check(True)
         """
         )
-        pytester.runpytest("--adaptavist")
+        pytester.inline_run("--adaptavist")
         _, _, etss = adaptavist_mock
         assert etss.call_count == 2
 
@@ -268,7 +251,7 @@ class TestMetaBlockUnit:
                     mb_2.check(True)
         """
         )
-        pytester.runpytest("--adaptavist")
+        pytester.inline_run("--adaptavist")
         _, _, etss = adaptavist_mock
         assert etss.call_count == 1
 
@@ -286,14 +269,14 @@ class TestMetaBlockUnit:
                     mb_2.check(True)
         """
         )
-        report = pytester.runpytest("--adaptavist", "-vv")
+        hook_record = pytester.inline_run("--adaptavist", "-vv")
         _, _, etss = adaptavist_mock
         for call in etss.call_args_list:
             assert "THIS SHOULD NOT BE DISPLAYED" not in call.kwargs["comment"]
         assert etss.call_count == 2
         assert etss.call_args.kwargs["step"] == 2
         assert etss.call_args.kwargs["status"] == "Pass"
-        report.assert_outcomes(skipped=1)
+        hook_record.assertoutcome(skipped=1)
 
     def test_meta_block_stop_method(self, pytester: pytest.Pytester, adaptavist_mock: AdaptavistMock):
         """Test Action.STOP_METHOD. We expect to not see step 2 and the second check of meta_block 1. TEST-T124 must be executed normally."""
@@ -314,7 +297,7 @@ class TestMetaBlockUnit:
                     mb_1.check(True)
         """
         )
-        pytester.runpytest("--adaptavist")
+        pytester.inline_run("--adaptavist")
         _, _, etss = adaptavist_mock
         assert etss.call_count == 2
         for call in etss.call_args_list:
@@ -394,7 +377,7 @@ class TestMetaBlockUnit:
                     mb_1.check(True)
         """
         )
-        pytester.runpytest("--adaptavist")
+        pytester.inline_run("--adaptavist")
         _, _, etss = adaptavist_mock
         assert etss.call_count == 1
         assert etss.call_args.kwargs["status"] == "Blocked"
@@ -417,7 +400,7 @@ class TestMetaBlockUnit:
                     mb_1.check(True)
         """
         )
-        pytester.runpytest("--adaptavist")
+        pytester.inline_run("--adaptavist")
         _, _, etss = adaptavist_mock
         assert etss.call_count == 1
         assert etss.call_args.kwargs["status"] == "Fail"
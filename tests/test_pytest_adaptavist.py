@@ -9,7 +9,27 @@ import pytest
 from _pytest.assertion.util import running_on_ci
 from adaptavist import Adaptavist
 
-from . import AdaptavistMock, get_test_values, system_test_preconditions
+from . import AdaptavistMock, GlobalConfig, get_test_values, system_test_preconditions
+
+
+TEST_T123_META_BLOCK = """
+import pytest
+
+def test_T123(meta_block):
+    with meta_block(1):
+        assert True
+"""
+
+TEST_CLASS_T121_T123 = """
+import pytest
+
+class TestClass():
+    def test_T121(self, meta_block):
+        pass
+
+    def test_T123(self, meta_block):
+        pass
+"""
 
 
 @pytest.mark.usefixtures("configure")
@@ -33,24 +53,15 @@ class TestPytestAdaptavistUnit:
         assert "passed" not in outcome
 
     @pytest.mark.usefixtures("adaptavist_mock")
-    def test_default_test_project(self, pytester: pytest.Pytester):
+    def test_default_test_project(self, pytester: pytest.Pytester, global_config: GlobalConfig):
         """Test if a project is set to TEST if not found in markers, testcasename or config."""
-        pytester.makepyfile(
-            """
-            import pytest
-
-            def test_T123(meta_block):
-                with meta_block(1):
-                    assert True
-        """
-        )
-        with open("config/global_config.json", "w", encoding="utf8") as file:
-            file.write('{"test_run_key":"TEST-C1"}')
+        pytester.makepyfile(TEST_T123_META_BLOCK)
+        global_config({"test_run_key": "TEST-C1"})
         hook_record = pytester.inline_run("--adaptavist")
         assert hook_record.matchreport().head_line == "test_T123"
 
     @pytest.mark.usefixtures("adaptavist_mock")
-    def test_skip_no_test_case_methods(self, pytester: pytest.Pytester):
+    def test_skip_no_test_case_methods(self, pytester: pytest.Pytester, global_config: GlobalConfig):
         """Test if a test method which is not a valid adaptavist test case is skipped, if 'skip_ntc_methods' is set"""
         pytester.makepyfile(
             """
@@ -61,24 +72,16 @@ class TestPytestAdaptavistUnit:
                     assert True
         """
         )
-        with open("config/global_config.json", "w", encoding="utf8") as file:
-            file.write('{"skip_ntc_methods": true}')
-        pytester.runpytest("--adaptavist").assert_outcomes(skipped=1)
+        global_config({"skip_ntc_methods": True})
+        pytester.inline_run("--adaptavist").assertoutcome(skipped=1)
 
-    def test_early_return_on_no_config(self, pytester: pytest.Pytester, adaptavist_mock: AdaptavistMock):
+    def test_early_return_on_no_config(
+        self, pytester: pytest.Pytester, adaptavist_mock: AdaptavistMock, global_config: GlobalConfig
+    ):
         """Test the early return in create_report if config is not valid."""
-        pytester.makepyfile(
-            """
-            import pytest
-
-            def test_T123(meta_block):
-                with meta_block(1):
-                    assert True
-        """
-        )
-        with open("config/global_config.json", "w", encoding="utf8") as file:
-            file.write("{}")
-        pytester.runpytest("--adaptavist")
+        pytester.makepyfile(TEST_T123_META_BLOCK)
+        global_config({})
+        pytester.inline_run("--adaptavist")
         ctr, etrs, etss = adaptavist_mock
         assert ctr.call_count == 0
         assert etrs.call_count == 0
@@ -101,7 +104,7 @@ class TestPytestAdaptavistUnit:
         """
         )
         with patch("adaptavist.Adaptavist.get_test_result", return_value={"scriptResults": [{"index": "0"}]}):
-            pytester.runpytest("--adaptavist")
+            pytester.inline_run("--adaptavist")
         _, etrs, _ = adaptavist_mock
         assert etrs.call_count == 1
         assert etrs.call_args.kwargs["status"] == "Not Executed"
@@ -109,32 +112,28 @@ class TestPytestAdaptavistUnit:
     def test_test_case_reporting(self, pytester: pytest.Pytester, adaptavist_mock: AdaptavistMock):
         """Test that a testcase is reported correctly. The steps must not reported in this test."""
         pytester.makepyfile(
-            """
+            test_pass="""
             import pytest
 
             def test_T123(meta_block):
                 with meta_block() as mb:
                     mb.check(True)
-        """
+            """,
+            test_fail="""
+            import pytest
+
+            def test_T124(meta_block):
+                with meta_block() as mb:
+                    mb.check(False)
+            """,
         )
         with patch("adaptavist.Adaptavist.get_test_result", return_value={"scriptResults": [{"index": "0"}]}):
-            pytester.runpytest("--adaptavist")
-            _, etrs, _ = adaptavist_mock
-            assert etrs.call_count == 1
-            assert etrs.call_args.kwargs["status"] == "Pass"
-
-            pytester.makepyfile(
-                """
-                import pytest
-
-                def test_T123(meta_block):
-                    with meta_block() as mb:
-                        mb.check(False)
-            """
-            )
-            pytester.runpytest("--adaptavist")
-            assert etrs.call_count == 2
-            assert etrs.call_args.kwargs["status"] == "Fail"
+            pytester.inline_run("--adaptavist")
+        ctr, etrs, _ = adaptavist_mock
+        assert sorted(call.kwargs["test_case_key"] for call in ctr.call_args_list) == ["TEST-T123", "TEST-T124"]
+        assert etrs.call_count == 2
+        status = {call.kwargs["test_case_key"]: call.kwargs["status"] for call in etrs.call_args_list}
+        assert status == {"TEST-T123": "Pass", "TEST-T124": "Fail"}
 
     @pytest.mark.usefixtures("adaptavist_mock")
     def test_result_attachment(self, pytester: pytest.Pytester):
@@ -150,13 +149,13 @@ class TestPytestAdaptavistUnit:
         """
         )
         with patch("adaptavist.Adaptavist.add_test_result_attachment") as atra:
-            pytester.runpytest("--adaptavist")
+            pytester.inline_run("--adaptavist")
         assert atra.call_count == 1
         assert isinstance(atra.call_args.kwargs["attachment"], BytesIO)
         assert atra.call_args.kwargs["filename"] == "test.txt"
 
     @pytest.mark.usefixtures("adaptavist_mock")
-    def test_skipped_test_cases_keys(self, pytester: pytest.Pytester):
+    def test_skipped_test_cases_keys(self, pytester: pytest.Pytester, global_config: GlobalConfig):
         """Test that testcases which are not defined in test_case_keys are skipped."""
         pytester.makepyfile(
             """
@@ -176,19 +175,16 @@ class TestPytestAdaptavistUnit:
         """
         )
         # Test that test cases skipped if append-to-cycle is off and test_case_keys are set
-        with open("config/global_config.json", "w", encoding="utf8") as file:
-            file.write('{"project_key": "TEST", "test_run_key":"TEST-C1", "test_case_keys": ["TEST-T123"]}')
-        pytester.runpytest("--adaptavist").assert_outcomes(passed=1, skipped=2)
+        global_config({"project_key": "TEST", "test_run_key": "TEST-C1", "test_case_keys": ["TEST-T123"]})
+        pytester.inline_run("--adaptavist").assertoutcome(passed=1, skipped=2)
 
         # Test that test cases which are not defined in test_case_keys are skipped if append-to-cycle is on
-        with open("config/global_config.json", "w", encoding="utf8") as file:
-            file.write('{"project_key": "TEST", "test_run_key":"TEST-C1", "test_case_keys": ["TEST-T125"]}')
-        pytester.runpytest("--adaptavist", "--append-to-cycle").assert_outcomes(failed=1, skipped=2)
+        global_config({"project_key": "TEST", "test_run_key": "TEST-C1", "test_case_keys": ["TEST-T125"]})
+        pytester.inline_run("--adaptavist", "--append-to-cycle").assertoutcome(failed=1, skipped=2)
 
         # Test that test cases run if append-to-cycle is on and test_case_keys are not set
-        with open("config/global_config.json", "w", encoding="utf8") as file:
-            file.write('{"project_key": "TEST", "test_run_key":"TEST-C1", "test_case_keys": []}')
-        pytester.runpytest("--adaptavist", "--append-to-cycle").assert_outcomes(passed=2, failed=1)
+        global_config({"project_key": "TEST", "test_run_key": "TEST-C1", "test_case_keys": []})
+        pytester.inline_run("--adaptavist", "--append-to-cycle").assertoutcome(passed=2, failed=1)
 
     @pytest.mark.usefixtures("adaptavist_mock")
     def test_xfail(self, pytester: pytest.Pytester):
@@ -228,24 +224,14 @@ class TestPytestAdaptavistUnit:
         regex = re.findall("\\(not not False", str(outcome.outlines).replace("'", "").replace("[", "").replace("]", ""))
         assert len(regex) == 2 if running_on_ci() else 1
 
-    def test_reporting_skipped_test_cases(self, pytester: pytest.Pytester, adaptavist_mock: AdaptavistMock):
+    def test_reporting_skipped_test_cases(
+        self, pytester: pytest.Pytester, adaptavist_mock: AdaptavistMock, global_config: GlobalConfig
+    ):
         """Don't report a test case if it is not in test_case_keys."""
-        pytester.makepyfile(
-            """
-            import pytest
-
-            class TestClass():
-                def test_T121(self, meta_block):
-                    pass
-
-                def test_T123(self, meta_block):
-                    pass
-        """
-        )
-        with open("config/global_config.json", "w", encoding="utf8") as file:
-            file.write('{"test_case_keys": ["TEST-T123"]}')
+        pytester.makepyfile(TEST_CLASS_T121_T123)
+        global_config({"test_case_keys": ["TEST-T123"]})
         _, etrs, _ = adaptavist_mock
-        pytester.runpytest("--adaptavist")
+        pytester.inline_run("--adaptavist")
         assert etrs.call_args_list[0].kwargs["test_case_key"] == "TEST-T123"
         assert etrs.call_count == 1
 
@@ -260,39 +246,21 @@ class TestPytestAdaptavistUnit:
             """
         )
         result = pytester.runpytest("--test_run_name=abc", "--adaptavist")
-        assert any(
-            "PytestDeprecationWarning: test_run_name is deprecated. Please use --test-cycle-name" in line
-            for line in result.outlines
-        )
+        assert "PytestDeprecationWarning: test_run_name is deprecated. Please use --test-cycle-name" in str(result.stdout)
 
         result = pytester.runpytest("--test_plan_name=abc", "--adaptavist")
-        assert any(
-            "PytestDeprecationWarning: test_plan_name is deprecated. Please use --test-plan-name" in line
-            for line in result.outlines
-        )
+        assert "PytestDeprecationWarning: test_plan_name is deprecated. Please use --test-plan-name" in str(result.stdout)
 
     @pytest.mark.usefixtures("adaptavist_mock")
-    def test_test_run_name(self, pytester: pytest.Pytester):
+    def test_test_run_name(self, pytester: pytest.Pytester, global_config: GlobalConfig):
         """Test that test_run_name template is working."""
         with patch("adaptavist.Adaptavist.create_test_run", return_value="TEST-C123") as ctr, patch(
             "adaptavist.Adaptavist.get_test_run_by_name", return_value={}
         ):
-            pytester.makepyfile(
-                """
-                import pytest
-
-                class TestClass():
-                    def test_T121(self, meta_block):
-                        pass
-
-                    def test_T123(self, meta_block):
-                        pass
-            """
-            )
-            with open("config/global_config.json", "w", encoding="utf8") as file:
-                file.write('{"jira_server": "https://jira.test", "project_key": "TEST"}')
+            pytester.makepyfile(TEST_CLASS_T121_T123)
+            global_config({"jira_server": "https://jira.test", "project_key": "TEST"})
 
-            pytester.runpytest("--adaptavist")
+            pytester.inline_run("--adaptavist")
             assert "TEST test run" in ctr.call_args_list[0][1]["test_run_name"]
 
             pytester.makeini(
@@ -301,31 +269,19 @@ class TestPytestAdaptavistUnit:
             test_run_name = Change test_run_name %(project_key)
             """
             )
-            pytester.runpytest("--adaptavist")
+            pytester.inline_run("--adaptavist")
             assert ctr.call_args[1]["test_run_name"] == "Change test_run_name TEST"
 
     @pytest.mark.usefixtures("adaptavist_mock")
-    def test_test_plan_name_template(self, pytester: pytest.Pytester):
+    def test_test_plan_name_template(self, pytester: pytest.Pytester, global_config: GlobalConfig):
         """Test that test_run_name template is working."""
         with patch("adaptavist.Adaptavist.create_test_plan") as ctp, patch(
             "adaptavist.Adaptavist.get_test_plans", return_value={}
         ):
-            pytester.makepyfile(
-                """
-                import pytest
-
-                class TestClass():
-                    def test_T121(self, meta_block):
-                        pass
+            pytester.makepyfile(TEST_CLASS_T121_T123)
+            global_config({"jira_server": "https://jira.test", "project_key": "TEST", "test_plan_suffix": "suffix"})
 
-                    def test_T123(self, meta_block):
-                        pass
-            """
-            )
-            with open("config/global_config.json", "w", encoding="utf8") as file:
-                file.write('{"jira_server": "https://jira.test", "project_key": "TEST", "test_plan_suffix": "suffix"}')
-
-            pytester.runpytest("--adaptavist")
+            pytester.inline_run("--adaptavist")
             assert "TEST suffix" in ctp.call_args_list[0][1]["test_plan_name"]
 
             pytester.makeini(
@@ -334,29 +290,17 @@ class TestPytestAdaptavistUnit:
                 test_plan_name = Change test_plan_name %(project_key)
             """
             )
-            pytester.runpytest("--adaptavist")
+            pytester.inline_run("--adaptavist")
             assert "Change test_plan_name TEST" == ctp.call_args[1]["test_plan_name"]
 
     @pytest.mark.usefixtures("adaptavist_mock")
-    def test_test_run_name_invalid_key(self, pytester: pytest.Pytester):
+    def test_test_run_name_invalid_key(self, pytester: pytest.Pytester, global_config: GlobalConfig):
         """Test that test_run_name template is working."""
         with patch("adaptavist.Adaptavist.create_test_run", return_value="TEST-C123"), patch(
             "adaptavist.Adaptavist.get_test_run_by_name", return_value={}
         ):
-            pytester.makepyfile(
-                """
-                import pytest
-
-                class TestClass():
-                    def test_T121(self, meta_block):
-                        pass
-
-                    def test_T123(self, meta_block):
-                        pass
-            """
-            )
-            with open("config/global_config.json", "w", encoding="utf8") as file:
-                file.write('{"jira_server": "https://jira.test", "project_key": "TEST"}')
+            pytester.makepyfile(TEST_CLASS_T121_T123)
+            global_config({"jira_server": "https://jira.test", "project_key": "TEST"})
             pytester.makeini(
                 """
                 [pytest]
@@ -365,7 +309,7 @@ class TestPytestAdaptavistUnit:
             )
             outcome = pytester.runpytest("--adaptavist")
             assert outcome.ret == 6
-            assert any("project_ey" in line for line in outcome.outlines)
+            assert "project_ey" in str(outcome.stdout)
 
 
 @pytest.mark.system